@@ -33,7 +33,7 @@ from fastmcp import FastMCP
 
 # Import  functionality
 from tab_generation import (
-    generate_tab_output,
+    generate_tab_output_cached,
     check_attempt_limit as check_attempt_limit
 )
 
@@ -614,7 +614,7 @@ def generate_tab(tab_data: str) -> TabResponse:
 
         # Generate  tab with all new features
         logger.debug("Starting  tab generation")
-        return generate_tab_output(request)
+        return generate_tab_output_cached(request)
 
     except json.JSONDecodeError as e:
         logger.error(f"JSON parsing error: {e}")
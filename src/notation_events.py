@@ -9,9 +9,8 @@ Updated Pydantic models compatible with V2 syntax using:
 - Updated Field syntax and validation patterns
 """
 
-import sys
 import logging
-from typing import Dict, ClassVar, Type, List, Any, Optional, Union, Literal
+from typing import Dict, ClassVar, Type, List, Any, Optional, Union, Literal, Tuple
 from pydantic import BaseModel, Field, field_validator, ValidationError
 from time_signatures import ( get_time_signature_config, get_strum_positions_for_time_signature, calculate_char_position )
 from tab_models import TabRequest, TabError, TabFormatError, ConflictError
@@ -19,17 +18,13 @@ from tab_models import TabRequest, TabError, TabFormatError, ConflictError
 # Import our constants
 from tab_constants import (
     DynamicLevel, DisplayLayer,
-    VALID_EMPHASIS_VALUES, MAX_FRET, MAX_STRING, MIN_STRING,
-    MAX_SEMITONES, MIN_SEMITONES, SUPERSCRIPT_SYMBOLS, SUBSCRIPT_SYMBOLS,
-    DEFAULT_SYMBOLS
+    VALID_EMPHASIS_VALUES, VALID_EMPHASIS_SET, VALID_STRUM_DIRECTIONS, MAX_FRET, MAX_STRING, MIN_STRING,
+    MAX_SEMITONES, MIN_SEMITONES, MAX_PALM_MUTE_DURATION, MUTED_FRET_VALUES, SEMITONE_FRACTIONS, SUPERSCRIPT_TABLE, SUBSCRIPT_TABLE,
+    DEFAULT_TABLE, SUPERSCRIPT_DIGITS_TABLE, SUBSCRIPT_DIGITS_TABLE
 )
 
-# Configure logging to stderr only (stdout reserved for MCP protocol)
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    stream=sys.stderr
-)
+# Logging is configured by the entry point (mcp_server.py, run_tests.py);
+# library modules only create their logger
 logger = logging.getLogger(__name__)
 
 
@@ -56,18 +51,20 @@ class NotationEvent(BaseModel):
         else:
             raise ValueError(f"Invalid style '{style}'. Valid: {valid_styles}")
     
+    @classmethod
+    def reset_technique_toggle(cls):
+        """Restart the alternating-style counters of every event type."""
+        for event_class in cls._registry.values():
+            event_class._technique_toggle = 0
+
     def get_alternating_style(self) -> str:
         """Get the current style for alternating mode."""
         self.__class__._technique_toggle += 1
         return "superscript" if self.__class__._technique_toggle % 2 == 0 else "subscript"
     
     def map_str(self, text: str, char_map: Dict) -> str:
-        """Convert entire string (digits and technique symbols) to superscript."""
-        result = ""
-        for char in text:
-            result += char_map.get(char, char)
-
-        return result
+        """Convert entire string (digits and technique symbols) using a str.translate table."""
+        return text.translate(char_map)
     
     def format_technique(self, technique_type: str, part1: str, 
                         part2: str, style: Optional[str] = None
@@ -98,11 +95,11 @@ class NotationEvent(BaseModel):
             style_selector = self.get_alternating_style()
         
         # Choose proper mapping method for chars
-        char_map: Dict = DEFAULT_SYMBOLS
+        char_map: Dict = DEFAULT_TABLE
         if style_selector == "superscript":
-            char_map = SUPERSCRIPT_SYMBOLS
+            char_map = SUPERSCRIPT_TABLE
         elif style_selector == "subscript":
-            char_map = SUBSCRIPT_SYMBOLS
+            char_map = SUBSCRIPT_TABLE
 
         return (self.map_str(f"{part1}{technique_type}{part2}", char_map))
     
@@ -120,8 +117,8 @@ class NotationEvent(BaseModel):
         # Use Pydantic validation when constructing
         try:
           return subclass(**{k: v for k, v in data.items() if k != "type"})
-        except Exception as e:
-          print(f"Failed to instantiate {subclass} with data {data}")
+        except Exception:
+          logger.debug("Failed to instantiate %s with data %s", subclass, data)
           raise
     
     def __init_subclass__(cls, type=None, **kwargs):
@@ -133,10 +130,16 @@ class NotationEvent(BaseModel):
         cls._registry[type] = cls
         cls._type = type   # Store the key on the class (useful for debugging)
     
+    @property
+    def effective_beat(self) -> Optional[float]:
+        """Beat this event is placed at: 'beat' when set, otherwise 'startBeat'."""
+        beat = getattr(self, 'beat', None)
+        return getattr(self, 'startBeat', None) if beat is None else beat
+
     @field_validator('emphasis')
     @classmethod
     def validate_emphasis(cls, v):
-        if v is not None and v not in VALID_EMPHASIS_VALUES:
+        if v is not None and v not in VALID_EMPHASIS_SET:
             raise ValueError(f"Invalid emphasis '{v}'. Valid values: {VALID_EMPHASIS_VALUES}")
         return v
 
@@ -170,7 +173,7 @@ class Note(MusicalEvent, type="note"):
     @classmethod
     def validate_fret(cls, v):
         if isinstance(v, str):
-            if v.lower() not in ['x']:
+            if v not in MUTED_FRET_VALUES:
                 raise ValueError("String fret values must be 'x' for muted strings")
         elif isinstance(v, (int, float)):
             if v < 0 or v > MAX_FRET:
@@ -179,7 +182,7 @@ class Note(MusicalEvent, type="note"):
     
     def generate_notation(self):
         # Handle muted strings and vibrato
-        if isinstance(self.fret, str) and self.fret.lower() == "x":
+        if self.fret in MUTED_FRET_VALUES:
             fret_str = "x"
         else:
             fret_str = str(self.fret)
@@ -278,40 +281,20 @@ class Bend(MusicalEvent, type="bend"):
         """
 
         # Handle muted strings in bends (unusual but possible)
-        if isinstance(self.fret, str) and self.fret.lower() == "x":
+        if self.fret in MUTED_FRET_VALUES:
             fret_str = "x"
         else:
             fret_str = str(self.fret)
 
-        semitone_str = str(self.semitones)
-
         # Handle common fraction cases with Unicode symbols
-        match self.semitones:
-            case 0.25:
-                semitone_str = "¼"
-            case 0.5:
-                semitone_str = "½"
-            case 0.75:
-                semitone_str = "¾"
-            case 1.25:
-                semitone_str = "1¼"
-            case 1.5:
-                semitone_str = "1½"
-            case 1.75:
-                semitone_str = "1¾"
-            case 2.25:
-                semitone_str = "2¼"
-            case 2.5:
-                semitone_str = "2½"
-            case 2.75:
-                semitone_str = "2¾"
-            case 3.0:
-                semitone_str = "3"
-        
-        # Handle whole numbers (remove .0)
-        if self.semitones == int(self.semitones):
-            semitone_str = str(int(self.semitones))
-        # Fallback for unusual decimal values
+        semitone_str = SEMITONE_FRACTIONS.get(self.semitones)
+        if semitone_str is None:
+            # Handle whole numbers (remove .0)
+            if self.semitones == int(self.semitones):
+                semitone_str = str(int(self.semitones))
+            # Fallback for unusual decimal values
+            else:
+                semitone_str = str(self.semitones)
 
         technique_str = self.format_technique("b", fret_str, semitone_str)
 
@@ -373,7 +356,10 @@ class PullOff(MusicalEvent, type="pullOff"):
             notation += "~"
 
         return notation
-    
+
+# Techniques whose notation can collide with long emphasis markings
+EMPHASIS_SENSITIVE_TECHNIQUES = (Bend, Slide, HammerOn, PullOff)
+
 # ============================================================================
 # New Event Types
 # ============================================================================
@@ -388,10 +374,9 @@ class StrumPattern(NotationEvent, type="strumPattern"):
     @field_validator('pattern')
     @classmethod
     def validate_pattern(cls, v):
-        valid_values = ["D", "U", ""]
-        for direction in v:
-            if direction not in valid_values:
-                raise ValueError(f"Invalid strum direction '{direction}'. Use 'D', 'U', or ''")
+        if not VALID_STRUM_DIRECTIONS.issuperset(v):
+            direction = next(d for d in v if d not in VALID_STRUM_DIRECTIONS)
+            raise ValueError(f"Invalid strum direction '{direction}'. Use 'D', 'U', or ''")
         return v
     
     def process_strum_pattern(
@@ -410,17 +395,17 @@ class StrumPattern(NotationEvent, type="strumPattern"):
             strum_chars: Character array for strum pattern layer
             total_width: Total width of the display
         """
-        config = get_time_signature_config(time_signature)
-        positions_per_measure = len(config["valid_beats"])
+        valid_beats = get_time_signature_config(time_signature)["valid_beats"]
+        positions_per_measure = len(valid_beats)
 
-        logger.debug(f"Processing strum pattern: {len(self.pattern)} positions, {self.measures} measures")
+        logger.debug("Processing strum pattern: %s positions, %s measures", len(self.pattern), self.measures)
 
         # For now, assume the pattern starts at the beginning of the measure group
         pattern_start_measure = 0  # Relative to current measure group
 
         # Check if current measure is covered by this pattern
         if current_measure < pattern_start_measure or current_measure >= pattern_start_measure + self.measures:
-            logger.debug(f"Measure {current_measure} not covered by pattern (starts at {pattern_start_measure}, spans {self.measures})")
+            logger.debug("Measure %s not covered by pattern (starts at %s, spans %s)", current_measure, pattern_start_measure, self.measures)
             return
 
         measure_offset_in_pattern = current_measure - pattern_start_measure
@@ -432,24 +417,24 @@ class StrumPattern(NotationEvent, type="strumPattern"):
 
     # Validate pattern slice bounds
         if pattern_start_idx >= len(self.pattern):
-            logger.warning(f"Pattern start index {pattern_start_idx} exceeds pattern length {len(self.pattern)}")
+            logger.warning("Pattern start index %s exceeds pattern length %s", pattern_start_idx, len(self.pattern))
             return
 
-        logger.debug(f"Measure {current_measure}: using pattern slice [{pattern_start_idx}:{pattern_end_idx}] = {measure_pattern}")
+        logger.debug("Measure %s: using pattern slice [%s:%s] = %s", current_measure, pattern_start_idx, pattern_end_idx, measure_pattern)
 
         # Place each strum direction at its corresponding beat position
         for i, direction in enumerate(measure_pattern):
             if direction:  # Skip empty positions
                 beat_idx = i
-                if beat_idx < len(config["valid_beats"]):
-                    beat = config["valid_beats"][beat_idx]
+                if beat_idx < positions_per_measure:
+                    beat = valid_beats[beat_idx]
                     char_position = calculate_char_position(beat, current_measure, time_signature)
 
                     if char_position < total_width:
                         strum_chars[char_position] = direction
-                        logger.debug(f"Placed strum '{direction}' at position {char_position} for beat {beat}")
+                        logger.debug("Placed strum '%s' at position %s for beat %s", direction, char_position, beat)
                     else:
-                        logger.warning(f"Character position {char_position} exceeds total width {total_width}")
+                        logger.warning("Character position %s exceeds total width %s", char_position, total_width)
     @classmethod
     def validate_strum_patterns(cls, request: TabRequest) -> TabError:
         """
@@ -464,10 +449,12 @@ class StrumPattern(NotationEvent, type="strumPattern"):
         time_sig = request.timeSignature
         expected_positions = get_strum_positions_for_time_signature(time_sig)
 
-        logger.debug(f"Validating strum patterns for {time_sig} (expecting {expected_positions} positions per measure)")
+        logger.debug("Validating strum patterns for %s (expecting %s positions per measure)", time_sig, expected_positions)
 
         for part in request.parts:
-            active_patterns = []  # Track overlapping patterns within this part
+            # Measures are visited in order, so a new pattern overlaps an earlier
+            # one exactly when it starts at or before the furthest end seen so far
+            last_end_measure = -1
 
             logger.debug("Validating strum patterns in part '%s'", part.name)
 
@@ -476,58 +463,66 @@ class StrumPattern(NotationEvent, type="strumPattern"):
                     if event.get("type") != "strumPattern":
                         continue
 
-                    logger.debug(f"Found strum pattern in part '{part.name}' measure {measure_idx}")
-
-                    pattern = event.get("pattern", [])
-                    measures_spanned = event.get("measures", 1)
-                    start_beat = event.get("startBeat", 1.0)
-
-                    # Validate pattern length
-                    expected_length = expected_positions * measures_spanned
-                    if len(pattern) != expected_length:
-                        logger.error(f"Strum pattern length mismatch in part '{part.name}': got {len(pattern)}, expected {expected_length}")
-                        return TabFormatError(
-                            part = part.name,
-                            measure = measure_idx,
-                            message = f"Strum pattern in part '{part.name}' has {len(pattern)} positions, expected {expected_length} for {measures_spanned} measures of {time_sig}",
-                            suggestion = f"Pattern should have {expected_length} elements for {measures_spanned} measures of {time_sig}. Each measure needs {expected_positions} positions."
-                        )
-
-                    # Validate pattern values
-                    for i, direction in enumerate(pattern):
-                        if direction not in ["D", "U", ""]:
-                            logger.error(f"Invalid strum direction '{direction}' at position {i} in part '{part.name}'")
-                            return TabFormatError(
-                                part = part.name,
-                                measure = measure_idx,
-                                message = f"Invalid strum direction '{direction}' at position {i} in part '{part.name}'",
-                                suggestion = "Use 'D' for down, 'U' for up, or '' for no strum"
-                            )
-
-                    # Check for pattern overlaps within this part
-                    pattern_info = {
-                        "start_measure": measure_idx,
-                        "end_measure": measure_idx + measures_spanned - 1,
-                        "start_beat": start_beat
-                    }
-
-                    for existing_pattern in active_patterns:
-                        if (pattern_info["start_measure"] <= existing_pattern["end_measure"] and
-                            pattern_info["end_measure"] >= existing_pattern["start_measure"]):
-                            logger.error(f"Overlapping strum patterns detected in part '{part.name}'")
-                            return ConflictError(
-                                part = part.name,
-                                measure = measure_idx,
-                                message = f"Overlapping strum patterns detected in part '{part.name}'",
-                                suggestion = "Only one strum pattern can be active at a time within a part"
-                            )
-
-                    active_patterns.append(pattern_info)
-                    logger.debug(f"Strum pattern validated in part '{part.name}': {measures_spanned} measures, {len(pattern)} positions")
+                    strum_error = cls.validate_strum_pattern(event, part.name, measure_idx, last_end_measure,
+                                                             time_sig, expected_positions)
+                    if strum_error:
+                        return strum_error
+
+                    last_end_measure = max(last_end_measure, measure_idx + event.get("measures", 1) - 1)
 
         logger.debug("Strum pattern validation passed")
         return None
 
+    @classmethod
+    def validate_strum_pattern(cls, event: Dict[str, Any], part_name: str, measure_idx: int,
+                               last_end_measure: int, time_sig: str, expected_positions: int) -> TabError:
+        """
+        Validate a single strum pattern event from a part.
+
+        measure_idx is 0-based, and last_end_measure is the furthest measure
+        covered by earlier patterns in the same part (-1 if none).
+        """
+        logger.debug("Found strum pattern in part '%s' measure %s", part_name, measure_idx)
+
+        pattern = event.get("pattern", ())
+        measures_spanned = event.get("measures", 1)
+
+        # Validate pattern length
+        expected_length = expected_positions * measures_spanned
+        if len(pattern) != expected_length:
+            logger.error("Strum pattern length mismatch in part '%s': got %s, expected %s", part_name, len(pattern), expected_length)
+            return TabFormatError(
+                part = part_name,
+                measure = measure_idx,
+                message = f"Strum pattern in part '{part_name}' has {len(pattern)} positions, expected {expected_length} for {measures_spanned} measures of {time_sig}",
+                suggestion = f"Pattern should have {expected_length} elements for {measures_spanned} measures of {time_sig}. Each measure needs {expected_positions} positions."
+            )
+
+        # Validate pattern values; only search for the offending
+        # position once the bulk check has found one
+        if not VALID_STRUM_DIRECTIONS.issuperset(pattern):
+            i, direction = next((i, d) for i, d in enumerate(pattern) if d not in VALID_STRUM_DIRECTIONS)
+            logger.error("Invalid strum direction '%s' at position %s in part '%s'", direction, i, part_name)
+            return TabFormatError(
+                part = part_name,
+                measure = measure_idx,
+                message = f"Invalid strum direction '{direction}' at position {i} in part '{part_name}'",
+                suggestion = "Use 'D' for down, 'U' for up, or '' for no strum"
+            )
+
+        # Check for pattern overlaps within this part
+        if measure_idx <= last_end_measure:
+            logger.error("Overlapping strum patterns detected in part '%s'", part_name)
+            return ConflictError(
+                part = part_name,
+                measure = measure_idx,
+                message = f"Overlapping strum patterns detected in part '{part_name}'",
+                suggestion = "Only one strum pattern can be active at a time within a part"
+            )
+
+        logger.debug("Strum pattern validated in part '%s': %s measures, %s positions", part_name, measures_spanned, len(pattern))
+        return None
+
 class GraceNote(MusicalEvent, type="graceNote"):
     """Grace note - small note played quickly before main note."""
     string: int = Field(..., ge=MIN_STRING, le=MAX_STRING)
@@ -539,33 +534,11 @@ class GraceNote(MusicalEvent, type="graceNote"):
 
     def convert_to_superscript(self, digit_string: str) -> str:
         """Convert digit string to superscript Unicode."""
-        superscript_map = {
-            '0': '⁰', '1': '¹', '2': '²', '3': '³', '4': '⁴',
-            '5': '⁵', '6': '⁶', '7': '⁷', '8': '⁸', '9': '⁹'
-        }
-
-        result = ""
-        for char in digit_string:
-            if char in superscript_map:
-                result += superscript_map[char]
-            else:
-                result += char  # Keep non-digits as-is
-        return result
+        return digit_string.translate(SUPERSCRIPT_DIGITS_TABLE)  # Non-digits are kept as-is
 
     def convert_to_subscript(self, digit_string: str) -> str:
         """Convert digit string to subscript Unicode."""
-        subscript_map = {
-            '0': '₀', '1': '₁', '2': '₂', '3': '₃', '4': '₄',
-            '5': '₅', '6': '₆', '7': '₇', '8': '₈', '9': '₉'
-        }
-
-        result = ""
-        for char in digit_string:
-            if char in subscript_map:
-                result += subscript_map[char]
-            else:
-                result += char  # Keep non-digits as-is
-        return result
+        return digit_string.translate(SUBSCRIPT_DIGITS_TABLE)  # Non-digits are kept as-is
 
     def generate_notation(self) -> str:
         # Convert grace fret to superscript
@@ -578,17 +551,24 @@ class GraceNote(MusicalEvent, type="graceNote"):
         return f"{sscript_grace}{self.fret}"
     
     @classmethod
-    def validate_grace_note_conflicts(cls, grace_notes: List[Dict], events_by_position: Dict, part_name: str, measure: int) -> TabError:
+    def validate_grace_note_conflicts(cls, grace_notes: List["GraceNote"], events_by_position: Dict[Tuple[int, float], NotationEvent], part_name: str, measure: int) -> TabError:
         """
         Check for conflicts between grace notes and main notes in parts-based schema.
+
+        events_by_position is keyed by (string, beat) tuples, as built by
+        validate_events. Build it once per measure and pass every grace note
+        in that measure in a single call, so each check is one dict lookup.
         """
+        if not grace_notes:
+            return None
+
         for grace_note in grace_notes:
             # Each grace_note should be a GraceNote
             string_num = grace_note.string
             beat = grace_note.beat
 
             # Check if there's a main note at the same position
-            position_key = f"{string_num}_{beat}"
+            position_key = (string_num, beat)
             if position_key not in events_by_position:
                 return TabFormatError(
                     part = part_name,
@@ -662,10 +642,14 @@ class Dynamic(NotationEvent, type="dynamic"):
 #  Annotation Events
 # ============================================================================
 
+# Dash runs for palm mute notation, indexed by dash count (two per beat,
+# up to the longest duration PalmMute accepts)
+PALM_MUTE_DASHES = tuple("-" * num_dashes for num_dashes in range(int(MAX_PALM_MUTE_DURATION * 2) + 1))
+
 class PalmMute(NotationEvent, type="palmMute"):
     """ palm mute with intensity levels."""
     beat: float
-    duration: float = Field(default=1.0, gt=0, le=8.0)
+    duration: float = Field(default=1.0, gt=0, le=MAX_PALM_MUTE_DURATION)
     intensity: Optional[Literal["light", "medium", "heavy"]] = None
     intensity_map: Dict = {"light": "(L)", "medium": "(M)", "heavy": "(H)"}
     layer: DisplayLayer = DisplayLayer.ANNOTATIONS
@@ -689,7 +673,7 @@ class PalmMute(NotationEvent, type="palmMute"):
 
         # Add duration dashes
         num_dashes = max(1, int(self.duration * 2))
-        return base + "-" * num_dashes
+        return base + PALM_MUTE_DASHES[num_dashes]
 
 class Chuck(NotationEvent, type="chuck"):
     """ chuck with emphasis levels."""
@@ -8,6 +8,7 @@ strum patterns, dynamics, and emphasis markings.
 """
 
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
@@ -25,6 +26,9 @@ class StrumDirection(Enum):
     def __str__(self):
         return self.value
 
+# Valid strum pattern entries, as a set for constant-time membership tests
+VALID_STRUM_DIRECTIONS = frozenset(d.value for d in StrumDirection)
+
 # Strum pattern validation - positions per measure by time signature
 class Instrument(Enum):
     """Supported string instruments."""
@@ -82,8 +86,13 @@ INSTRUMENT_CONFIGS = {
     }
 
 
+@lru_cache(maxsize=16)
 def get_instrument_config(instrument_str: str) -> InstrumentConfig:
-    """Get configuration for instrument string."""
+    """
+    Get configuration for instrument string.
+
+    Results are memoized; invalid names raise ValueError and are not cached.
+    """
     instrument = Instrument(instrument_str)
     return INSTRUMENT_CONFIGS[instrument]
 
@@ -127,6 +136,10 @@ VALID_EMPHASIS_VALUES = (
     [e.value for e in ArticulationMark] +
     ["dim.", "cresc."]  # Additional text-based markings
 )
+VALID_EMPHASIS_SET = frozenset(VALID_EMPHASIS_VALUES)
+
+# Soft dynamics, which may not come through on bends
+SOFT_DYNAMICS = frozenset({DynamicLevel.PIANISSIMO.value, DynamicLevel.PIANO.value})
 
 # ============================================================================
 #  Event Type Constants
@@ -167,6 +180,17 @@ MAX_STRING = 12
 MIN_STRING = 1
 MAX_SEMITONES = 3.0
 MIN_SEMITONES = 0.25
+MAX_PALM_MUTE_DURATION = 8.0  # Beats
+
+# String fret values accepted for a muted string
+MUTED_FRET_VALUES = frozenset({"x", "X"})
+
+# Bend amounts written with Unicode fractions
+SEMITONE_FRACTIONS = {
+    0.25: "¼", 0.5: "½", 0.75: "¾",
+    1.25: "1¼", 1.5: "1½", 1.75: "1¾",
+    2.25: "2¼", 2.5: "2½", 2.75: "2¾",
+}
 
 # Strum pattern constraints
 MAX_STRUM_PATTERN_MEASURES = 8  # Maximum measures a strum pattern can span
@@ -191,6 +215,15 @@ DEFAULT_SYMBOLS = {"0": "0", "1": "1", "2": "2", "3": "3", "4": "4",
                     "5": "5", "6": "6", "7": "7", "8": "8", "9": "9",
                     "h": "h", "p": "p", "b": "b", "/": "/", "\\": "\\"}
 
+# str.translate tables for the symbol maps above
+SUPERSCRIPT_TABLE = str.maketrans(SUPERSCRIPT_SYMBOLS)
+SUBSCRIPT_TABLE = str.maketrans(SUBSCRIPT_SYMBOLS)
+DEFAULT_TABLE = str.maketrans(DEFAULT_SYMBOLS)
+
+# Digit-only tables, for grace note frets
+SUPERSCRIPT_DIGITS_TABLE = str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹")
+SUBSCRIPT_DIGITS_TABLE = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+
 
 class DisplayLayer(Enum):
     """Different layers of information displayed in tabs."""
@@ -205,15 +238,15 @@ class DisplayLayer(Enum):
         return self.value
 
 # Display layer ordering (top to bottom)
-DISPLAY_LAYER_ORDER = [
+DISPLAY_LAYER_ORDER = (
     DisplayLayer.CHORD_NAMES,
     DisplayLayer.DYNAMICS,
     DisplayLayer.ANNOTATIONS,
     DisplayLayer.BEAT_MARKERS,
     DisplayLayer.TAB_CONTENT,
-]
+)
 
 
 def is_valid_emphasis(emphasis: str) -> bool:
     """Check if an emphasis marking is valid."""
-    return emphasis in VALID_EMPHASIS_VALUES
+    return emphasis in VALID_EMPHASIS_SET
@@ -15,8 +15,9 @@ Key Enhancements:
 """
 
 # Import  models and constants
-import sys
 import logging
+import threading
+from collections import OrderedDict, defaultdict
 from typing import Dict, List, Any, Tuple, Optional
 
 
@@ -31,7 +32,7 @@ from tab_models import (
 from notation_events import (
     NotationEvent,
     Note, PalmMute, Chuck, Dynamic, StrumPattern, Chord,
-    GraceNote, Slide, Bend, HammerOn, PullOff
+    GraceNote, Slide, Bend, HammerOn, PullOff, EMPHASIS_SENSITIVE_TECHNIQUES
 )
 
 from time_signatures import (
@@ -39,46 +40,40 @@ from time_signatures import (
     calculate_char_position,
     generate_beat_markers,
     get_content_width,
+    get_measure_width,
     calculate_total_width
 )
 
-# Configure logging to stderr only (stdout reserved for MCP protocol)
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    stream=sys.stderr
-)
+# Logging is configured by the entry point (mcp_server.py, run_tests.py);
+# library modules only create their logger
 logger = logging.getLogger(__name__)
 
-
-
 # ============================================================================
 #  Tab Generation Engine
 # ============================================================================
 
 
 
-def generate_strum_line(measures: Measure,
-                        num_measures: int, time_signature: str) -> str:
-    """Generate strum line from measure strumPattern fields."""
-    total_width = calculate_total_width(time_signature, num_measures)
-    strum_chars = [' '] * total_width
+def place_measure_strum_patterns(measures: Measure, strum_chars: List[str],
+                                 time_signature: str, total_width: int):
+    """Place measure strumPattern fields into the strum pattern layer."""
+    # Positions within the first measure; later measures are a fixed width further on
+    valid_beats = get_time_signature_config(time_signature)["valid_beats"]
+    relative_positions = [calculate_char_position(beat, 0, time_signature) for beat in valid_beats]
+    measure_width = get_measure_width(time_signature)
 
     for measure_idx, measure in enumerate(measures):
         strum_pattern = measure.strumPattern
         if not strum_pattern:
             continue
 
-        config = get_time_signature_config(time_signature)
-        for pattern_idx, direction in enumerate(strum_pattern):
-            if direction and pattern_idx < len(config["valid_beats"]):
-                beat = config["valid_beats"][pattern_idx]
-                char_position = calculate_char_position(beat, measure_idx, time_signature)
+        measure_start = measure_idx * measure_width
+        for direction, relative_position in zip(strum_pattern, relative_positions):
+            if direction:
+                char_position = measure_start + relative_position
                 if char_position < total_width:
                     strum_chars[char_position] = direction
 
-    return "".join(strum_chars).rstrip()
-
 
 
 def generate_measure_group(
@@ -113,7 +108,7 @@ def generate_measure_group(
     # Combine all layers in proper order
     result = []
 
-    logger.debug(f"Generating  measure group: {num_measures} measures of {time_signature}")
+    logger.debug("Generating  measure group: %s measures of %s", num_measures, time_signature)
 
     # Generate all display layers
     display_layers = generate_all_display_layers(measures, num_measures, time_signature)
@@ -130,24 +125,26 @@ def generate_measure_group(
 
     content_width = get_content_width(time_signature)
 
+    # Every string shares the same measures: content + separator, repeated
+    measures_template = ("-" * content_width + "|") * num_measures
+
     for string_idx in range(measure_info["num_strings"]):
         note = measure_info["tuning"][string_idx].ljust(2)
-        line = note + "|"  # Start with opening separator
-        for measure_idx in range(num_measures):
-            line += "-" * content_width + "|"  # content + separator
-        string_lines.append(line)
+        # Lines are kept as lists of characters while events are placed, so
+        # each placement only writes its own characters
+        string_lines.append(list(note + "|" + measures_template))  # Start with opening separator
 
     # Place events on appropriate string lines
     for measure_idx, measure in enumerate(measures):
-        measure_warnings = place_measure_events(
-            measure, string_lines, measure_idx, start_index + measure_idx + 1, time_signature
+        place_measure_events(
+            measure, string_lines, measure_idx, start_index + measure_idx + 1, time_signature, warnings
         )
-        warnings.extend(measure_warnings)
 
-    # Add each display layer if it has content
+    # Add each display layer if it has content; generate_all_display_layers
+    # only keeps layers that are non-empty after rstrip
     for layer_name in DISPLAY_LAYER_ORDER:
         layer_content = display_layers.get(layer_name)
-        if layer_content and layer_content.strip():
+        if layer_content:
             result.append(layer_content)
 
     # Conditionally add beat markers, always add string lines
@@ -156,21 +153,14 @@ def generate_measure_group(
         result.append(beat_line)
 
     # Always string lines
-    result.extend(string_lines)
+    result.extend("".join(line_chars) for line_chars in string_lines)
 
     # Add strum pattern at the bottom if present
     strum_line = display_layers.get(DisplayLayer.STRUM_PATTERN)
-    if strum_line and strum_line.strip():
-        result.append(strum_line)
-
-    # Generate strum pattern line from measures
-    strum_line = generate_strum_line(measures, num_measures, time_signature)
-
-    # Add strum pattern if any measures have patterns
-    if strum_line and strum_line.strip():
+    if strum_line:
         result.append(strum_line)
 
-    logger.debug(f"Generated {len(result)} display lines for measure group")
+    logger.debug("Generated %s display lines for measure group", len(result))
     return result, warnings
 
 def generate_all_display_layers(
@@ -186,28 +176,30 @@ def generate_all_display_layers(
     """
     total_width = calculate_total_width(time_signature, num_measures)
 
-    logger.debug(f"Generating display layers for {num_measures} measures, width {total_width}")
+    logger.debug("Generating display layers for %s measures, width %s", num_measures, total_width)
 
-    # Initialize character arrays for each layer
-    layers = {
-        DisplayLayer.CHORD_NAMES: [' '] * total_width,
-        DisplayLayer.DYNAMICS: [' '] * total_width,
-        DisplayLayer.ANNOTATIONS: [' '] * total_width,
-        DisplayLayer.STRUM_PATTERN: [' '] * total_width
-    }
+    # Character arrays for each layer, created the first time an event writes
+    # to that layer; groups of plain notes never allocate any
+    layers = defaultdict(lambda: [' '] * total_width)
 
     # Process each measure
     for measure_idx, measure in enumerate(measures):
         process_measure_for_display_layers(measure, measure_idx, time_signature,
                                            layers, total_width)
 
+    # Measure-level strum patterns share the layer with strumPattern events,
+    # so a group never renders more than one strum line
+    if any(measure.strumPattern for measure in measures):
+        place_measure_strum_patterns(measures, layers[DisplayLayer.STRUM_PATTERN],
+                                     time_signature, total_width)
+
     # Convert character arrays to strings and remove trailing spaces
     result = {}
     for layer, char_array in layers.items():
         content = "".join(char_array).rstrip()
         if content:  # Only include non-empty layers
             result[layer] = content
-            logger.debug(f"Generated {layer.value}: '{content[:50]}{'...' if len(content) > 50 else ''}'")
+            logger.debug("Generated %s: '%s%s'", layer.value, content[:50], '...' if len(content) > 50 else '')
 
     return result
 
@@ -221,9 +213,8 @@ def process_measure_for_display_layers(
     """
     Process a single measure and populate all display layers.
     """
-    for event in measure.events:
-        event_class = NotationEvent.from_dict(event)
-        beat = getattr(event_class, 'beat', None) or getattr(event_class, 'startBeat', None)
+    for event_class in measure.notation_events():
+        beat = event_class.effective_beat
 
         # Only working with beat-based logic here
         if beat is None:
@@ -263,35 +254,33 @@ def process_measure_for_display_layers(
 
 def place_measure_events(
     measure: Measure,
-    string_lines: List[str],
+    string_lines: List[List[str]],
     measure_offset: int,
     measure_number: int,
-    time_signature: str
-) -> List[Dict[str, Any]]:
+    time_signature: str,
+    warnings: List[Dict[str, Any]]
+) -> None:
     """
      version of place_measure_events with support for new event types.
 
     Args:
         measure: Single measure dictionary containing events list
-        string_lines: Mutable list of 6 strings representing guitar tab lines
+        string_lines: One mutable character list per string, representing the tab lines
         measure_offset: Position of this measure within the current group (0-3)
         measure_number: Absolute measure number for error reporting (1-based)
         time_signature: Time signature string for proper positioning
-
-    Returns:
-        List of warning dictionaries for formatting issues
+        warnings: Warning dictionaries for formatting issues, appended to in place
     """
-    warnings = []
+    warnings_before = len(warnings)
     # Grace notes should always be followed by a target note, which should not be placed
     graceNotePlaced = False
 
-    logger.debug(f"Placing events for measure {measure_number} (offset {measure_offset})")
+    logger.debug("Placing events for measure %s (offset %s)", measure_number, measure_offset)
 
-    for event in measure.events:
-        event_class = NotationEvent.from_dict(event)
+    for event_class in measure.notation_events():
 
         if isinstance(event_class, (PalmMute, Chuck, StrumPattern, Dynamic)):
-            logger.debug(f"Skipping {event_class._type} - handled in display layers")
+            logger.debug("Skipping %s - handled in display layers", event_class._type)
             graceNotePlaced = False
             continue
 
@@ -299,19 +288,17 @@ def place_measure_events(
         if isinstance(event_class, (GraceNote)):
             char_position = calculate_char_position(event_class.beat, measure_offset, time_signature)
             notation = event_class.generate_notation()
-            string_lines[event_class.string - 1] = replace_chars_at_position(string_lines[event_class.string - 1], char_position, notation)
+            replace_chars_at_position(string_lines[event_class.string - 1], char_position, notation)
 
             # Update warning for new shorter notation
             if len(notation) > 2:
-                warnings.append({
-                    "warningType": "formatting_warning",
-                    "measure": measure_number,
-                    "beat": event_class.beat,
-                    "message": f"Grace note notation '{notation}' may require template adjustment",
-                    "suggestion": f"Grace note uses {len(notation)} character positions"
-                })
-
-            logger.debug(f"Placed grace note '{notation}' at position {char_position}")
+                warnings.append(formatting_warning(
+                    measure_number, event_class.beat,
+                    f"Grace note notation '{notation}' may require template adjustment",
+                    f"Grace note uses {len(notation)} character positions"
+                ))
+
+            logger.debug("Placed grace note '%s' at position %s", notation, char_position)
             
             graceNotePlaced = True
             continue
@@ -321,45 +308,42 @@ def place_measure_events(
             continue
         
         # Handle regular musical events
-        event_warnings = place_event_on_tab(event_class, string_lines, measure_offset, measure_number, time_signature)
-        warnings.extend(event_warnings)
+        place_event_on_tab(event_class, string_lines, measure_offset, measure_number, time_signature, warnings)
         graceNotePlaced = False
 
-    logger.debug(f"Placed events for measure {measure_number}, generated {len(warnings)} warnings")
-    return warnings
+    logger.debug("Placed events for measure %s, generated %s warnings", measure_number, len(warnings) - warnings_before)
 
 
 def place_event_on_tab(
     event_class: NotationEvent,
-    string_lines: List[str],
+    string_lines: List[List[str]],
     measure_offset: int,
     measure_number: int,
-    time_signature: str
-) -> List[Dict[str, Any]]:
+    time_signature: str,
+    warnings: List[Dict[str, Any]]
+) -> None:
     """
     version of place_event_on_tab with emphasis support.
 
     Places musical events on tab lines and handles emphasis markings
-    by adjusting the notation (when possible in UTF-8 format).
+    by adjusting the notation (when possible in UTF-8 format). Warnings
+    are appended to the caller's list.
     """
-    warnings = []
     emphasis = event_class.emphasis
 
     match event_class:
         case Note():
             char_position = calculate_char_position(event_class.beat, measure_offset, time_signature)
             fret_str = event_class.generate_notation()
-            string_lines[event_class.string - 1] = replace_chars_at_position(string_lines[event_class.string - 1], char_position, fret_str)
+            replace_chars_at_position(string_lines[event_class.string - 1], char_position, fret_str)
 
             # Warn about multi-digit frets or vibrato that may cause alignment issues
             if len(fret_str) > 1:
-                warnings.append({
-                    "warningType": "formatting_warning",
-                    "measure": measure_number,
-                    "beat": event_class.beat,
-                    "message": f"Multi-digit fret ({fret_str}) may affect template alignment",
-                    "suggestion": f"Fret {fret_str} uses {len(fret_str)} character positions"
-                })
+                warnings.append(formatting_warning(
+                    measure_number, event_class.beat,
+                    f"Multi-digit fret ({fret_str}) may affect template alignment",
+                    f"Fret {fret_str} uses {len(fret_str)} character positions"
+                ))
 
         case Chord():
             char_position = calculate_char_position(event_class.beat, measure_offset, time_signature)
@@ -371,84 +355,82 @@ def place_event_on_tab(
                 fret = str(fret_info["fret"])
                 line_index = string_num - 1
 
-                string_lines[line_index] = replace_chars_at_position(string_lines[line_index], char_position, fret)
+                replace_chars_at_position(string_lines[line_index], char_position, fret)
                 max_fret_width = max(max_fret_width, len(fret))
 
             # Warn about chords with wide fret numbers
             if max_fret_width > 1:
-                warnings.append({
-                    "warningType": "formatting_warning",
-                    "measure": measure_number,
-                    "beat": event_class.beat,
-                    "message": f"Chord with multi-digit frets may affect alignment",
-                    "suggestion": f"Chord requires {max_fret_width} character positions"
-                })
+                warnings.append(formatting_warning(
+                    measure_number, event_class.beat,
+                    f"Chord with multi-digit frets may affect alignment",
+                    f"Chord requires {max_fret_width} character positions"
+                ))
 
         case HammerOn() | PullOff():
             char_position = calculate_char_position(event_class.startBeat, measure_offset, time_signature)
             technique_str = event_class.generate_notation()
-            string_lines[event_class.string - 1] = replace_chars_at_position(string_lines[event_class.string - 1], char_position, technique_str)
+            replace_chars_at_position(string_lines[event_class.string - 1], char_position, technique_str)
 
             # Warn about wide technique notations
             if len(technique_str) > 3:
-                warnings.append({
-                    "warningType": "formatting_warning",
-                    "measure": measure_number,
-                    "beat": event_class.beat,
-                    "message": f"Technique notation '{technique_str}' may require template adjustment",
-                    "suggestion": f"Technique uses {len(technique_str)} character positions"
-                })
+                warnings.append(formatting_warning(
+                    measure_number, event_class.beat,
+                    f"Technique notation '{technique_str}' may require template adjustment",
+                    f"Technique uses {len(technique_str)} character positions"
+                ))
 
         case Slide():
             char_position = calculate_char_position(event_class.startBeat, measure_offset, time_signature)
             technique_str = event_class.generate_notation()
 
-            string_lines[event_class.string - 1] = replace_chars_at_position(string_lines[event_class.string - 1], char_position, technique_str)
+            replace_chars_at_position(string_lines[event_class.string - 1], char_position, technique_str)
 
             if len(technique_str) > 3:
-                warnings.append({
-                    "warningType": "formatting_warning",
-                    "measure": measure_number,
-                    "beat": event_class.beat,
-                    "message": f"Slide notation '{technique_str}' may require template adjustment",
-                    "suggestion": f"Slide uses {len(technique_str)} character positions"
-                })
+                warnings.append(formatting_warning(
+                    measure_number, event_class.beat,
+                    f"Slide notation '{technique_str}' may require template adjustment",
+                    f"Slide uses {len(technique_str)} character positions"
+                ))
 
         case Bend():
             char_position = calculate_char_position(event_class.beat, measure_offset, time_signature)
             # Generate notation with Unicode fraction semitone amounts
             technique_str = event_class.generate_notation()
-            string_lines[event_class.string - 1] = replace_chars_at_position(string_lines[event_class.string - 1], char_position, technique_str)
+            replace_chars_at_position(string_lines[event_class.string - 1], char_position, technique_str)
 
             # Add warning for wide bend notations
             if len(technique_str) > 2:
-                warnings.append({
-                    "warningType": "formatting_warning",
-                    "measure": measure_number,
-                    "beat": event_class.beat,
-                    "message": f"Bend notation '{technique_str}' may require template adjustment",
-                    "suggestion": f"Bend notation uses {len(technique_str)} character positions"
-                    })
+                warnings.append(formatting_warning(
+                    measure_number, event_class.beat,
+                    f"Bend notation '{technique_str}' may require template adjustment",
+                    f"Bend notation uses {len(technique_str)} character positions"
+                ))
 
     # Add emphasis-related warnings if needed
-    if emphasis and isinstance(event_class, (Bend, Slide, HammerOn, PullOff)):
+    if emphasis and isinstance(event_class, EMPHASIS_SENSITIVE_TECHNIQUES):
         # Complex techniques with emphasis may need special attention
         if len(emphasis) > 2:  # Long emphasis markings
-            beat = getattr(event_class, 'beat', None) or getattr(event_class, 'startBeat', None)
-            warnings.append({
-                "warningType": "formatting_warning",
-                "measure": measure_number,
-                "beat": beat,
-                "message": f"Technique with emphasis '{emphasis}' may affect spacing",
-                "suggestion": "Consider using shorter emphasis markings for techniques"
-            })
-
-    return warnings
+            beat = event_class.effective_beat
+            warnings.append(formatting_warning(
+                measure_number, beat,
+                f"Technique with emphasis '{emphasis}' may affect spacing",
+                "Consider using shorter emphasis markings for techniques"
+            ))
 
 # ============================================================================
 #  Utility Functions
 # ============================================================================
 
+def formatting_warning(measure: int, beat: Optional[float], message: str, suggestion: str) -> Dict[str, Any]:
+    """Build a formatting warning entry for TabResponse.warnings."""
+    return {
+        "warningType": "formatting_warning",
+        "measure": measure,
+        "beat": beat,
+        "message": message,
+        "suggestion": suggestion
+    }
+
 def place_annotation_text_wEvent(event: NotationEvent, char_array: List[str],):
     {
         #layerToUse = layers[event.layer]
@@ -480,15 +462,25 @@ def place_annotation_text(
     Side Effects:
         Modifies char_array in place by setting characters at specified positions
     """
-    for i, char in enumerate(text):
-        target_pos = position + i
-        if target_pos < max_width and target_pos >= 0:
-            # Check for overlap unless allowed
-            if not allow_overlap and char_array[target_pos] != ' ':
-                logger.debug(f"Annotation overlap at position {target_pos}: existing '{char_array[target_pos]}', new '{char}'")
-                # For now, skip placement - could implement conflict resolution
-                continue
-            char_array[target_pos] = char
+    start = max(position, 0)
+    end = min(position + len(text), max_width)
+    if start >= end:
+        return
+
+    # Usual case: the target span is free, so copy the text in one slice
+    if allow_overlap or char_array[start:end].count(' ') == end - start:
+        char_array[start:end] = text[start - position:end - position]
+        return
+
+    # Overlap: existing characters win, only the free slots take new text.
+    # For now, skip placement - could implement conflict resolution
+    existing = char_array[start:end]
+    logger.debug("Annotation overlap at positions %s-%s: existing '%s', new '%s'",
+                 start, end - 1, "".join(existing), text[start - position:end - position])
+    char_array[start:end] = [
+        char if current == ' ' else current
+        for current, char in zip(existing, text[start - position:end - position])
+    ]
 
 
 def generate_tab_output(request: TabRequest) -> TabResponse:
@@ -509,7 +501,7 @@ def generate_tab_output(request: TabRequest) -> TabResponse:
     Returns:
         Tuple of (tab_string, warnings_list)
     """
-    logger.info(f"Generating parts-based tab for '{request.title}'")
+    logger.info("Generating parts-based tab for '%s'", request.title)
 
     # This will be the response object
     response: TabResponse = TabResponse(
@@ -530,14 +522,14 @@ def generate_tab_output(request: TabRequest) -> TabResponse:
     NotationEvent.set_technique_style(request.techniqueStyle)
     
     # Reset count for new tab generation
-    NotationEvent._technique_count = 0
+    NotationEvent.reset_technique_toggle()
 
     # Process song structure
     try:
         instances = process_song_structure(request)
-        logger.info(f"Generated {len(instances)} part instances")
+        logger.info("Generated %s part instances", len(instances))
     except Exception as e:
-        logger.error(f"Failed to process song structure: {e}")
+        logger.error("Failed to process song structure: %s", e)
 
         response.success = False
         response.content = f"Error processing song structure: {e}"
@@ -556,14 +548,14 @@ def generate_tab_output(request: TabRequest) -> TabResponse:
             tuning = request.tuning
         else:
             tuning = config.tuning
-        logger.debug(f"Generating tab for {config.name} ({num_strings} strings)")
+        logger.debug("Generating tab for %s (%s strings)", config.name, num_strings)
     except ValueError:
         num_strings = 6  # Default to guitar
-        logger.warning(f"Unknown instrument {instrument_str}, defaulting to 6 strings")
+        logger.warning("Unknown instrument %s, defaulting to 6 strings", instrument_str)
 
     # Generate each part instance
     for instance in instances:
-        logger.debug(f"Generating tab for {instance.display_name}")
+        logger.debug("Generating tab for %s", instance.display_name)
 
         # Add part header
         if request.showPartHeaders:
@@ -575,19 +567,20 @@ def generate_tab_output(request: TabRequest) -> TabResponse:
         part_measures = instance.measures
         part_time_sig = instance.time_signature_change or request.timeSignature
 
+        # Create temporary data for existing generation logic; it is the same
+        # for every group in the part, and each group's measures are passed
+        # to generate_measure_group directly
+        measure_info = {
+            "title": f"{instance.display_name}",
+            "timeSignature": part_time_sig,
+            "num_strings": num_strings,
+            "tuning": tuning
+        }
+
         # Process measures in groups of 4
         for measure_group_start in range(0, len(part_measures), 4):
             measure_group = part_measures[measure_group_start:measure_group_start + 4]
 
-            # Create temporary data for existing generation logic
-            measure_info = {
-                "title": f"{instance.display_name}",
-                "timeSignature": part_time_sig,
-                "measures": measure_group,
-                "num_strings": num_strings,
-                "tuning": tuning
-            }
-
             # Generate measure group
             tab_section, section_warnings = generate_measure_group(
                 measure_group, measure_group_start, part_time_sig, measure_info
@@ -598,13 +591,46 @@ def generate_tab_output(request: TabRequest) -> TabResponse:
 
         output_lines.append("")  # Extra space between parts
 
-    logger.info(f"Generated parts-based tab with {len(warnings)} warnings")
+    logger.info("Generated parts-based tab with %s warnings", len(warnings))
 
     response.content = "\n".join(output_lines)
     response.warnings = warnings
     return response
 
 
+# Most recently generated responses, keyed by the request's JSON form
+TAB_OUTPUT_CACHE_SIZE = 128
+_tab_output_cache: "OrderedDict[str, TabResponse]" = OrderedDict()
+# Guards the cache and rendering: technique style and toggle state live on
+# the NotationEvent classes, so concurrent renders would mix their styles
+_tab_output_lock = threading.Lock()
+
+def generate_tab_output_cached(request: TabRequest) -> TabResponse:
+    """
+    Generate tab output, reusing the response for a repeated request.
+
+    An identical request (as serialized by pydantic) gets a copy of the
+    earlier response. Copies are handed out so callers can't modify the
+    cached entry. Rendering reads class-level style state on NotationEvent,
+    so lookup, generation and insertion all happen under one lock; this
+    keeps concurrent tool calls (run in a threadpool) from caching output
+    rendered with another request's style.
+    """
+    key = request.model_dump_json()
+    with _tab_output_lock:
+        cached = _tab_output_cache.get(key)
+        if cached is not None:
+            logger.debug("Reusing cached tab output for '%s'", request.title)
+            _tab_output_cache.move_to_end(key)
+            return cached.model_copy(deep=True)
+
+        response = generate_tab_output(request)
+        _tab_output_cache[key] = response.model_copy(deep=True)
+        if len(_tab_output_cache) > TAB_OUTPUT_CACHE_SIZE:
+            _tab_output_cache.popitem(last=False)
+    return response
+
+
 # ============================================================================
 # Header Generation Functions
 # ============================================================================
@@ -690,39 +716,35 @@ def generate_part_header(instance: SongPart, request: TabRequest) -> List[str]:
     return lines
 
 
-def replace_chars_at_position(line: str, position: int, replacement: str) -> str:
+def replace_chars_at_position(line_chars: List[str], position: int, replacement: str) -> None:
     """
-    Replace characters in string at specific position, maintaining string length.
+    Replace characters in a tab line at specific position, maintaining line length.
 
     This is a critical utility that must preserve the exact character alignment
-    of the tab template. We convert to list for efficient character replacement,
-    then back to string.
+    of the tab template. The line is a list of characters and is modified in
+    place, so placing an event only touches the characters it replaces.
 
     Edge case handling: If replacement is longer than remaining space,
     we truncate rather than extending the line (which would break alignment).
     """
-    line_list = list(line)
+    end = min(position + len(replacement), len(line_chars))
+    if end > position:
+        line_chars[position:end] = replacement[:end - position]
 
-    for i, char in enumerate(replacement):
-        target_pos = position + i
-        if target_pos < len(line_list):
-            line_list[target_pos] = char
-        else:
-            # Character position beyond line length - this shouldn't happen
-            # with proper template sizing, but we handle it gracefully
-            logger.warning(f"Character position {target_pos} beyond line length {len(line_list)}")
-            break
-
-    return "".join(line_list)
+    if end < position + len(replacement):
+        # Character position beyond line length - this shouldn't happen
+        # with proper template sizing, but we handle it gracefully
+        logger.warning("Character position %s beyond line length %s", max(end, position), len(line_chars))
 
 # ============================================================================
 # Error Handling Utilities
 # ============================================================================
 
+# Regeneration attempts allowed before check_attempt_limit reports an error
+MAX_ATTEMPTS = 5
+
 def check_attempt_limit(attempt: int) -> ProcessingError:
     """ attempt limit checking with parts-specific guidance."""
-    MAX_ATTEMPTS = 5
-
     if attempt > MAX_ATTEMPTS:
         return ProcessingError(
             message = f"Maximum regeneration attempts reached ({attempt})",
@@ -9,11 +9,10 @@ Updated Pydantic models compatible with V2 syntax using:
 - Updated Field syntax and validation patterns
 """
 
-import sys
 import logging
 import json
-from typing import Dict, List, Any, Optional, Literal
-from pydantic import BaseModel, Field, field_validator
+from typing import TYPE_CHECKING, Dict, Iterator, List, Any, Optional, Literal
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from tab_constants import Instrument, get_instrument_config
 
 # Import our constants
@@ -24,12 +23,11 @@ from tab_constants import (
 
 from time_signatures import get_supported_time_signatures
 
-# Configure logging to stderr only (stdout reserved for MCP protocol)
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    stream=sys.stderr
-)
+if TYPE_CHECKING:
+    from notation_events import NotationEvent
+
+# Logging is configured by the entry point (mcp_server.py, run_tests.py);
+# library modules only create their logger
 logger = logging.getLogger(__name__)
 
 # Errors defined here to avoid circular imports...
@@ -115,12 +113,32 @@ class Measure(BaseModel):
     """Single measure containing events and optional strum pattern."""
     events: List[Dict[str, Any]] = Field(default_factory=list)
     strumPattern: Optional[List[str]] = None
+
+    # Parsed form of events, filled in as notation_events() reaches them
+    _notation_events: List["NotationEvent"] = PrivateAttr(default_factory=list)
     
     @field_validator('strumPattern')
     @classmethod
     def validate_strum_pattern_length(cls, v, info):
         # Add time signature validation here
         return v
+
+    def notation_events(self) -> Iterator["NotationEvent"]:
+        """
+        Yield this measure's events as NotationEvent models.
+
+        Each event dict is parsed the first time it is reached, and the model
+        is reused by every later pass (validation, then each rendering pass).
+        Parsing stays lazy so an invalid event only raises once it is reached.
+        """
+        # Imported here because notation_events imports this module
+        from notation_events import NotationEvent
+
+        parsed = self._notation_events
+        for event_idx, event in enumerate(self.events):
+            if event_idx == len(parsed):
+                parsed.append(NotationEvent.from_dict(event))
+            yield parsed[event_idx]
     
 class SongPart(BaseModel):
     """
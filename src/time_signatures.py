@@ -22,7 +22,9 @@ Design Philosophy:
 - Easy to extend with new time signatures
 """
 
-from typing import Dict, List, Any, Tuple, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Tuple, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -124,9 +126,15 @@ def get_supported_time_signatures() -> List[str]:
     """Return list of all supported time signatures."""
     return list(TIME_SIGNATURE_CONFIGS.keys())
 
-def get_time_signature_config(time_signature: str) -> Dict[str, Any]:
+@lru_cache(maxsize=32)
+def get_time_signature_config(time_signature: str) -> Mapping[str, Any]:
     """
     Get complete configuration for a specific time signature.
+
+    Results are cached per time signature and shared between callers, so
+    the configuration is returned as a read-only view of the module table.
+    Nested lists (such as valid_beats) are shared too and must not be
+    modified; use get_valid_beats() for a mutable copy.
     
     Args:
         time_signature: String like "4/4", "3/4", "6/8"
@@ -146,7 +154,7 @@ def get_time_signature_config(time_signature: str) -> Dict[str, Any]:
         supported = ", ".join(get_supported_time_signatures())
         raise ValueError(f"Unsupported time signature: {time_signature}. Supported: {supported}")
     
-    return TIME_SIGNATURE_CONFIGS[time_signature].copy()
+    return MappingProxyType(TIME_SIGNATURE_CONFIGS[time_signature])
 
 def is_time_signature_supported(time_signature: str) -> bool:
     """Check if a time signature is supported."""
@@ -179,8 +187,8 @@ def is_beat_valid(beat: float, time_signature: str) -> bool:
         is_beat_valid(4.0, "3/4")  # False
     """
     try:
-        valid_beats = get_valid_beats(time_signature)
-        return beat in valid_beats
+        # Read-only membership test: use the cached list, not a copy
+        return beat in get_time_signature_config(time_signature)["valid_beats"]
     except ValueError:
         return False
 
@@ -201,19 +209,21 @@ def get_closest_valid_beat(beat: float, time_signature: str) -> float:
         get_closest_valid_beat(1.7, "4/4")  # Returns 1.5
         get_closest_valid_beat(4.9, "4/4")  # Returns 4.5
     """
-    valid_beats = get_valid_beats(time_signature)
+    valid_beats = get_time_signature_config(time_signature)["valid_beats"]
     return min(valid_beats, key=lambda x: abs(x - beat))
 
 # ============================================================================
 # Character Position Calculations
 # ============================================================================
 
+@lru_cache(maxsize=256)
 def calculate_char_position(beat: float, measure_offset: int, time_signature: str) -> int:
     """
     Calculate character position for a beat in any time signature.
     
     This is the core function that maps musical time to visual position
-    in the UTF-8 tablature format.
+    in the UTF-8 tablature format. Results are memoized, so the fallback
+    warning for an invalid beat is logged once per distinct call.
     
     Args:
         beat: Beat position within the measure (e.g., 1.0, 1.5)
@@ -234,15 +244,15 @@ def calculate_char_position(beat: float, measure_offset: int, time_signature: st
         calculate_char_position(1.0, 1, "3/4")  # Returns 16
     """
     config = get_time_signature_config(time_signature)
+    char_positions = config["char_positions"]
     
     # Get base position for this beat
-    if beat in config["char_positions"]:
-        base_position = config["char_positions"][beat]
-    else:
+    base_position = char_positions.get(beat)
+    if base_position is None:
         # Fallback: use closest valid beat
-        logger.warning(f"Beat {beat} not valid for {time_signature}, using closest valid beat")
+        logger.warning("Beat %s not valid for %s, using closest valid beat", beat, time_signature)
         closest_beat = get_closest_valid_beat(beat, time_signature)
-        base_position = config["char_positions"][closest_beat]
+        base_position = char_positions[closest_beat]
     
     # Add offset for measure position. +1 for the string note name
     return 2 + base_position + (measure_offset * config["measure_width"])
@@ -349,7 +359,7 @@ def _classify_time_signature(time_signature: str) -> str:
     }
     return classifications.get(time_signature, "Unknown")
 
-def _get_shortest_note_value(config: Dict[str, Any]) -> str:
+def _get_shortest_note_value(config: Mapping[str, Any]) -> str:
     """Determine the shortest note value representable."""
     if config["beat_subdivisions"] == 2:
         return "Eighth note"
@@ -15,16 +15,17 @@ Key Enhancements:
 """
 
 # Import  models and constants
-import sys
 import logging
-from typing import Dict, Any, Optional, Literal
+from typing import Dict, List, FrozenSet, Any, Optional, Literal
 from pydantic import ValidationError, BaseModel,Field
 
-from tab_models import TabRequest, Measure, TabError, TabFormatError, ConflictError
+from tab_models import TabRequest, TabError, TabFormatError, ConflictError
 
 from tab_constants import (
     VALID_EMPHASIS_VALUES,
+    SOFT_DYNAMICS,
     INSTRUMENT_CONFIGS,
+    InstrumentConfig,
     is_valid_emphasis,
     get_instrument_config
 )
@@ -32,22 +33,23 @@ from tab_constants import (
 from notation_events import (
     NotationEvent, GraceNote, StrumPattern, 
     Chord, Dynamic, PalmMute, Chuck,
-    HammerOn, Bend, PullOff, Slide )
+    HammerOn, Bend, PullOff, Slide, EMPHASIS_SENSITIVE_TECHNIQUES )
 
 from time_signatures import (
     get_strum_positions_for_time_signature,
     get_time_signature_config,
     get_valid_beats,
-    is_beat_valid,
     create_time_signature_error
 )
 
-# Configure logging to stderr only (stdout reserved for MCP protocol)
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    stream=sys.stderr
-)
+# Event classes that never occupy a string position
+NON_CONFLICTING_EVENTS = frozenset({StrumPattern, Dynamic, PalmMute, Chuck})
+
+# Event attributes that may hold a fret value
+FRET_FIELDS = ("fret", "fromFret", "toFret")
+
+# Logging is configured by the entry point (mcp_server.py, run_tests.py);
+# library modules only create their logger
 logger = logging.getLogger(__name__)
 
 
@@ -84,7 +86,7 @@ def validate_schema(request: TabRequest) -> TabError:
         )
 
     # Validate structure is an array
-    if not hasattr(request, "structure") or len(request.structure)== 0:
+    if not request.structure:
         return TabFormatError(
             message = "Structure must be a non-empty array",
             suggestion = "Provide structure array like: \"structure\": [\"Verse\", \"Chorus\"]"
@@ -104,17 +106,19 @@ def validate_schema(request: TabRequest) -> TabError:
                 suggestion = "Each part must have at least one measure with events"
             )
 
-        # Validate each measure has events array
+        # Validate each measure has events array. Pydantic has already
+        # coerced every entry to a Measure, so only emptiness needs checking.
         for measure_idx, measure in enumerate(part.measures, 1):
-            if not isinstance(measure, Measure) or not measure.events:
+            if not measure.events:
                 return TabFormatError(
                     message = f"Part '{part.name}' measure {measure_idx} missing events array",
                     suggestion = "Each measure must have an 'events' array (can be empty)"
                 )
 
     # Validate structure references existing parts
+    part_names = {part.name for part in request.parts}
     for part_name in request.structure:
-        if all(part.name != part_name for part in request.parts):
+        if part_name not in part_names:
             available_parts = [part.name for part in request.parts]
             return TabFormatError(
                 message = f"Structure references undefined part '{part_name}'",
@@ -125,17 +129,35 @@ def validate_schema(request: TabRequest) -> TabError:
     return None
 
 
-def validate_timing(request: TabRequest) -> TabError:
+def validate_events(request: TabRequest) -> TabError:
     """
-    Enhanced timing validation for parts-based schema.
+    Single-pass event validation for parts-based schema.
+
+    Walks every part, measure and event once, parsing each event a single
+    time and running the timing checks followed by the conflict checks
+    before moving on to the next event. A timing error is returned straight
+    away; the first conflict, strum pattern, emphasis and instrument error
+    is kept and reported in that order once the walk completes, so errors
+    take the same precedence as the original separate passes (every timing
+    error ahead of any conflict).
 
-    Validates beat timing for all events across all parts:
+    Timing checks:
     - Standard musical events (notes, chords, techniques)
     - New event types (strum patterns, grace notes, dynamics)
     - Compound time signatures (6/8 with triplet feel)
+
+    Conflict checks:
+    - Musical event conflicts (multiple notes on same string/beat)
+    - Grace note conflicts with main notes
+    - Technique-specific playability rules
+
+    Also checks:
+    - Strum pattern length, directions and overlaps
+    - Emphasis values
+    - String numbers against the instrument
     """
     time_sig = request.timeSignature
-    logger.debug("Validating timing for time signature: %s", time_sig)
+    logger.debug("Validating events for time signature: %s", time_sig)
 
     # Check if time signature is supported
     try:
@@ -145,170 +167,199 @@ def validate_timing(request: TabRequest) -> TabError:
         logger.error("Unsupported time signature: %s", time_sig)
         return create_time_signature_error(time_sig)
 
-    # Check every event's beat timing across all parts
+    # Time signature is fixed for the document, so build the beat lookup once
+    valid_beats = frozenset(config["valid_beats"])
+
+    # Will need to know what instrument to verify against number of strings
+    instrument = get_instrument_config(request.instrument)
+
+    expected_positions = get_strum_positions_for_time_signature(time_sig)
+    # Timing errors anywhere in the document take precedence over conflicts,
+    # so only the first conflict is remembered while the walk continues
+    conflict_error = strum_error = emphasis_error = instrument_error = None
+
+    # Per-measure conflict state, cleared rather than rebuilt for each measure
+    events_by_position = {}
+    grace_notes = []
+
     for part in request.parts:
-        logger.debug("Validating timing for part '%s'", part.name)
+        logger.debug("Validating events in part '%s'", part.name)
+
+        # Furthest measure (0-based) covered by a strum pattern in this part
+        last_end_measure = -1
 
         for measure_idx, measure in enumerate(part.measures, 1):
-            logger.debug("Validating timing for part '%s' measure %s", part.name, measure_idx)
-
-            for event_idx, event in enumerate(measure.events, 1):
-                event_class = NotationEvent.from_dict(event) 
-                
-                beat = getattr(event_class, 'beat', None) or getattr(event_class, 'startBeat', None)
-
-                if beat is None:
-                    logger.warning("Event %s in part '%s' measure %s missing beat timing",
-                        event_idx, part.name, measure_idx)
-                    return TabFormatError(
-                        part = part.name,
-                        measure = measure_idx,
-                        message = f"Event {event_idx} in part '{part.name}' missing beat timing",
-                        suggestion = "Add 'beat' or 'startBeat' field to event"
-                    )
+            events_by_position.clear()
+            grace_notes.clear()
+
+            logger.debug("Validating events in part '%s' measure %s", part.name, measure_idx)
+
+            for event_idx, (event, event_class) in enumerate(zip(measure.events, measure.notation_events()), 1):
+                beat = event_class.effective_beat
+
+                timing_error = validate_event_timing(event_class, beat, event_idx, time_sig, valid_beats,
+                                                     part.name, measure_idx)
+                if timing_error:
+                    return timing_error
+
+                if conflict_error is None:
+                    conflict_error = validate_event_conflicts(event_class, beat, events_by_position, grace_notes,
+                                                              part.name, measure_idx, instrument.strings)
+
+                if strum_error is None and isinstance(event_class, StrumPattern):
+                    strum_error = StrumPattern.validate_strum_pattern(event, part.name, measure_idx - 1,
+                                                                      last_end_measure, time_sig, expected_positions)
+                    last_end_measure = max(last_end_measure, measure_idx - 1 + event.get("measures", 1) - 1)
+
+                # Most events carry no emphasis; skip the call for them
+                if emphasis_error is None and event_class.emphasis is not None:
+                    emphasis_error = validate_event_emphasis(event_class, part.name, measure_idx)
+
+                if instrument_error is None:
+                    instrument_error = validate_event_instrument(event_class, instrument, measure_idx)
+
+            # Validate grace note conflicts
+            if conflict_error is None:
+                conflict_error = GraceNote.validate_grace_note_conflicts(grace_notes, events_by_position,
+                                                                         part.name, measure_idx)
 
-                match event_class:
-                    # Enhanced beat validation for different event types
-                    case GraceNote():
-                        # Grace notes have special timing requirements
-                        grace_result = GraceNote.validate_grace_note_timing(beat, time_sig,
-                                                                part.name, measure_idx)
-                        if grace_result:
-                            return grace_result
-                    case StrumPattern():
-                        # Strum patterns have their own validation (handled separately)
-                        logger.debug("Strum pattern found at beat %s - will validate separately", beat)
-                        continue
-                    case _:
-                        # Standard beat validation
-                        if not is_beat_valid(beat, time_sig):
-                            logger.warning("Invalid beat %s for %s in part '%s' measure %s",
-                                        beat, time_sig, part.name, measure_idx)
-                            return TabFormatError(
-                                part = part.name,
-                                measure = measure_idx,
-                                beat = beat,
-                                message = f"Beat {beat} invalid for {time_sig} time signature in part '{part.name}'",
-                                suggestion = f"Use valid beat values for {time_sig}: {', '.join(map(str, get_valid_beats(time_sig)))}"
-                            )
-
-    logger.debug("Enhanced timing validation passed")
+    if conflict_error:
+        return conflict_error
+
+    if strum_error or emphasis_error:
+        return strum_error or emphasis_error
+
+    if instrument_error:
+        logger.warning("Instrument validation failed: %s", instrument_error.message)
+        return instrument_error
+
+    logger.debug("Event validation passed")
     return None
 
 
-def validate_conflicts(request: TabRequest) -> TabError:
+def validate_event_timing(event_class: NotationEvent, beat: Optional[float], event_idx: int, time_sig: str,
+                          valid_beats: FrozenSet[float], part_name: str, measure_idx: int) -> TabError:
     """
-    Enhanced conflict detection for parts-based schema.
+    Validate beat timing for a single event placed at beat.
 
-    Checks for:
-    - Musical event conflicts (multiple notes on same string/beat)
-    - Grace note conflicts with main notes
-    - Strum pattern overlaps
-    - Dynamic marking conflicts
+    Grace notes have their own timing rules and strum patterns are
+    validated separately, everything else must land on one of valid_beats
+    (the precomputed beat set for time_sig).
     """
-    logger.debug("Starting enhanced conflict validation")
+    if beat is None:
+        logger.warning("Event %s in part '%s' measure %s missing beat timing",
+            event_idx, part_name, measure_idx)
+        return TabFormatError(
+            part = part_name,
+            measure = measure_idx,
+            message = f"Event {event_idx} in part '{part_name}' missing beat timing",
+            suggestion = "Add 'beat' or 'startBeat' field to event"
+        )
 
-    # Will need to know what instrument to verify against number of strings
-    instrument = get_instrument_config(request.instrument)
-    #print(f"events instrument: {event}, strings found: {instrument.strings}")
+    match event_class:
+        # Enhanced beat validation for different event types
+        case GraceNote():
+            # Grace notes have special timing requirements
+            return GraceNote.validate_grace_note_timing(beat, time_sig, part_name, measure_idx)
+        case StrumPattern():
+            # Strum patterns have their own validation (handled separately)
+            logger.debug("Strum pattern found at beat %s - will validate separately", beat)
+        case _:
+            # Standard beat validation
+            if beat not in valid_beats:
+                logger.warning("Invalid beat %s for %s in part '%s' measure %s",
+                            beat, time_sig, part_name, measure_idx)
+                return TabFormatError(
+                    part = part_name,
+                    measure = measure_idx,
+                    beat = beat,
+                    message = f"Beat {beat} invalid for {time_sig} time signature in part '{part_name}'",
+                    suggestion = f"Use valid beat values for {time_sig}: {', '.join(map(str, get_valid_beats(time_sig)))}"
+                )
 
-    for part in request.parts:
-        logger.debug(f"Validating conflicts in part '{part.name}'")
+    return None
 
-        for measure_idx, measure in enumerate(part.measures, 1):
-            events_by_position = {}
-            grace_notes = []
-
-            logger.debug(f"Validating conflicts in part '{part.name}' measure {measure_idx}")
-
-            for event in measure.events:
-                event_class = NotationEvent.from_dict(event) 
-
-                # Collect different event types for specialized validation
-                match event_class:
-                    case StrumPattern():
-                        # Maybe this used to do something useful...
-                        continue
-                    
-                    case GraceNote():
-                        grace_notes.append(event_class)
-                        continue
-                    
-                    case Dynamic() | PalmMute() | Chuck():
-                        # Annotation events don't conflict with musical events
-                        continue
-
-                    # Handle chord events specially - they can have multiple strings at same beat
-                    case Chord():
-                        beat = getattr(event_class, 'beat', None) 
-                        if not beat:
-                            return TabFormatError(
-                                part = part.name,
-                                measure = measure_idx,
-                                message = f"Chord event in part '{part.name}' missing 'beat' field",
-                                suggestion = "Add 'beat' field to chord event"
-                            )
-
-                        # Validate chord has frets array
-                        frets = getattr(event_class, 'frets', None) 
-                        if not frets:
-                            return TabFormatError(
-                                part = part.name,
-                                measure = measure_idx,
-                                beat = beat,
-                                message = f"Chord event in part '{part.name}' missing 'frets' array",
-                                suggestion = "Add 'frets' array with string/fret objects"
-                            )
-
-                        # Check for duplicate strings within the chord
-                        chord_strings = set()
-                        for fret_info in frets:
-                            string_num = fret_info.get("string")
-                            if string_num in chord_strings:
-                                return ConflictError(
-                                    part = part.name,
-                                    measure = measure_idx,
-                                    beat = beat,
-                                    message = f"Chord in part '{part.name}' has duplicate entries for string {string_num}",
-                                    suggestion = "Each string can only appear once per chord"
-                                )
-                            chord_strings.add(string_num)
-
-                        continue  # Skip position conflict checking for chords
-
-                # For non-chord events, check string/beat conflicts
-                string_num = event_class.string
-                beat = getattr(event_class, 'beat', None) or getattr(event_class, 'startBeat', None)
-
-                if not string_num or not beat:
-                    continue  # These will be caught by other validation
-
-                position_key = f"{string_num}_{beat}"
-
-                if position_key in events_by_position:
-                    logger.warning(f"Conflict detected: multiple events on string {string_num} at beat {beat} in part '{part.name}'")
+
+def validate_event_conflicts(event_class: NotationEvent, beat: Optional[float], events_by_position: Dict,
+                             grace_notes: List[GraceNote], part_name: str, measure_idx: int, strings: int) -> TabError:
+    """
+    Check a single event placed at beat for conflicts with earlier events in its measure.
+
+    Positioned events are recorded in events_by_position and grace notes
+    are collected in grace_notes; both are per-measure state owned by the
+    caller, which checks grace note targets once the measure is complete.
+    """
+    # Strum patterns and annotation events don't conflict with
+    # musical events; one set probe skips them all
+    if type(event_class) in NON_CONFLICTING_EVENTS:
+        return None
+
+    # Collect different event types for specialized validation
+    match event_class:
+        case GraceNote():
+            grace_notes.append(event_class)
+            return None
+
+        # Handle chord events specially - they can have multiple strings at same beat
+        case Chord():
+            if not beat:
+                return TabFormatError(
+                    part = part_name,
+                    measure = measure_idx,
+                    message = f"Chord event in part '{part_name}' missing 'beat' field",
+                    suggestion = "Add 'beat' field to chord event"
+                )
+
+            # Validate chord has frets array
+            frets = getattr(event_class, 'frets', None) 
+            if not frets:
+                return TabFormatError(
+                    part = part_name,
+                    measure = measure_idx,
+                    beat = beat,
+                    message = f"Chord event in part '{part_name}' missing 'frets' array",
+                    suggestion = "Add 'frets' array with string/fret objects"
+                )
+
+            # Check for duplicate strings within the chord
+            chord_strings = set()
+            for fret_info in frets:
+                string_num = fret_info.get("string")
+                if string_num in chord_strings:
                     return ConflictError(
-                        part = part.name,
+                        part = part_name,
                         measure = measure_idx,
                         beat = beat,
-                        message = f"Multiple events on string {string_num} at beat {beat} in part '{part.name}'",
-                        suggestion = "Move one event to different beat or different string"
+                        message = f"Chord in part '{part_name}' has duplicate entries for string {string_num}",
+                        suggestion = "Each string can only appear once per chord"
                     )
+                chord_strings.add(string_num)
 
-                events_by_position[position_key] = event_class
+            return None  # Skip position conflict checking for chords
 
-                # Validate technique-specific rules (enhanced)
-                technique_error = validate_technique_rules(event_class, part.name, measure_idx, beat, instrument.strings)
-                if technique_error:
-                    return technique_error
+    # For non-chord events, check string/beat conflicts
+    string_num = event_class.string
 
-            # Validate grace note conflicts
-            grace_conflict = GraceNote.validate_grace_note_conflicts(grace_notes, events_by_position, part.name, measure_idx)
-            if grace_conflict:
-                return grace_conflict
+    if not string_num or not beat:
+        return None  # These will be caught by other validation
 
-    logger.debug("Enhanced conflict validation passed")
-    return None
+    # Tuple keys hash cheaply and need no string formatting per event
+    position_key = (string_num, beat)
+
+    if position_key in events_by_position:
+        logger.warning("Conflict detected: multiple events on string %s at beat %s in part '%s'", string_num, beat, part_name)
+        return ConflictError(
+            part = part_name,
+            measure = measure_idx,
+            beat = beat,
+            message = f"Multiple events on string {string_num} at beat {beat} in part '{part_name}'",
+            suggestion = "Move one event to different beat or different string"
+        )
+
+    events_by_position[position_key] = event_class
+
+    # Validate technique-specific rules (enhanced)
+    return validate_technique_rules(event_class, part_name, measure_idx, beat, strings)
 
 
 def validate_emphasis_markings(request: TabRequest) -> TabError:
@@ -323,29 +374,37 @@ def validate_emphasis_markings(request: TabRequest) -> TabError:
     logger.debug("Validating emphasis markings")
 
     for part in request.parts:
-        logger.debug(f"Validating emphasis markings in part '{part.name}'")
+        logger.debug("Validating emphasis markings in part '%s'", part.name)
 
         for measure_idx, measure in enumerate(part.measures, 1):
-            for event in measure.events:
-                event_class = NotationEvent.from_dict(event)
-                emphasis = event_class.emphasis
-
-                if event_class.emphasis is not None:
-                    logger.debug(f"Found emphasis '{emphasis}' in part '{part.name}' measure {measure_idx}")
-
-                    if not is_valid_emphasis(emphasis):
-                        logger.error(f"Invalid emphasis value in part '{part.name}': {emphasis}")
-                        return  TabFormatError(
-                            part = part.name,
-                            measure = measure_idx,
-                            message = f"Invalid emphasis value '{emphasis}' in part '{part.name}'",
-                            suggestion = f"Use valid emphasis: {', '.join(VALID_EMPHASIS_VALUES[:10])}..."
-                        )
+            for event_class in measure.notation_events():
+                emphasis_error = validate_event_emphasis(event_class, part.name, measure_idx)
+                if emphasis_error:
+                    return emphasis_error
 
     logger.debug("Emphasis validation passed")
     return None
 
 
+def validate_event_emphasis(event_class: NotationEvent, part_name: str, measure_idx: int) -> TabError:
+    """Validate the emphasis marking, if any, on a single event."""
+    emphasis = event_class.emphasis
+
+    if emphasis is not None:
+        logger.debug("Found emphasis '%s' in part '%s' measure %s", emphasis, part_name, measure_idx)
+
+        if not is_valid_emphasis(emphasis):
+            logger.error("Invalid emphasis value in part '%s': %s", part_name, emphasis)
+            return  TabFormatError(
+                part = part_name,
+                measure = measure_idx,
+                message = f"Invalid emphasis value '{emphasis}' in part '{part_name}'",
+                suggestion = f"Use valid emphasis: {', '.join(VALID_EMPHASIS_VALUES[:10])}..."
+            )
+
+    return None
+
+
 def validate_technique_rules(event_class: NotationEvent, part_name: str, measure_idx: int, beat: float, strings: int) -> TabError:
     """
     Validate technique-specific rules that ensure playability and proper notation.
@@ -384,21 +443,23 @@ def validate_technique_rules(event_class: NotationEvent, part_name: str, measure
         )
 
     # Validate fret ranges (now supports "x" for muted strings)
-    for fret_field in ["fret", "fromFret", "toFret"]:
+    for fret_field in FRET_FIELDS:
         fret = getattr(event_class, fret_field, None)
         if fret is not None:
-            # Allow "x" or "X" for muted strings
-            if isinstance(fret, str) and fret.lower() == "x":
-                continue  # Valid muted string
-            elif isinstance(fret, (int, float)) and (fret < 0 or fret > 24):
-                return  TabFormatError(
-                    part = part_name,
-                    measure = measure_idx,
-                    beat = beat,
-                    message = f"Invalid fret number: {fret}",
-                    suggestion = "Fret numbers must be 0-24 or 'x' for muted strings"
-                )
-            elif not isinstance(fret, (int, float, str)):
+            # The models coerce frets to plain int or str (a bool input
+            # arrives as int), so exact type checks cover them; strings
+            # ("x" or "X" for muted strings) are allowed
+            fret_type = type(fret)
+            if fret_type is int or fret_type is float:
+                if fret < 0 or fret > 24:
+                    return  TabFormatError(
+                        part = part_name,
+                        measure = measure_idx,
+                        beat = beat,
+                        message = f"Invalid fret number: {fret}",
+                        suggestion = "Fret numbers must be 0-24 or 'x' for muted strings"
+                    )
+            elif fret_type is not str:
                 return  TabFormatError(
                     part = part_name,
                     measure = measure_idx,
@@ -448,11 +509,11 @@ def validate_technique_rules(event_class: NotationEvent, part_name: str, measure
     # Additional validation for emphasis on techniques
     emphasis = event_class.emphasis
 
-    if emphasis and isinstance(event_class, (Bend, Slide, HammerOn, PullOff)):
-        logger.debug(f"Validating emphasis '{emphasis}' on {event_class._type}")
+    if emphasis and isinstance(event_class, EMPHASIS_SENSITIVE_TECHNIQUES):
+        logger.debug("Validating emphasis '%s' on %s", emphasis, event_class._type)
 
         # Some emphasis markings don't make sense with certain techniques
-        if emphasis in ["pp", "p"] and isinstance(event_class, (Bend)):
+        if emphasis in SOFT_DYNAMICS and isinstance(event_class, Bend):
             logger.warning("Soft dynamics on bends may not be effective")
             # This is a warning, not an error
 
@@ -469,7 +530,7 @@ def validate_instrument_events(request: TabRequest) -> TabError:
 
     try:
         config = get_instrument_config(instrument_str)
-        logger.debug(f"Validating events for {config.name} ({config.strings} strings)")
+        logger.debug("Validating events for %s (%s strings)", config.name, config.strings)
     except ValueError as _:
         return  TabFormatError(
             message = f"Invalid instrument: {instrument_str}",
@@ -477,71 +538,56 @@ def validate_instrument_events(request: TabRequest) -> TabError:
         )
 
     for part in request.parts:
-        measures = part.measures
-
-        for measure_idx, measure in enumerate(measures, 1):
-            for _, event in enumerate(measure.events, 1):
-                event_class = NotationEvent.from_dict(event) 
-                # Validate string numbers
-                string_num = getattr(event_class, "string", None)
-                if string_num is not None:
-                    if not config.validate_string(string_num):
-                        return  TabFormatError(
-                            measure = measure_idx,
-                            message = f"Invalid string {string_num} for {config.name}",
-                            suggestion = f"Use strings 1-{config.strings} for {config.name}"
-                        )
-
-                # Validate chord frets
-                if isinstance( event_class, Chord):
-                    for fret_info in event_class.frets:
-                        chord_string = fret_info.get("string")
-                        if chord_string and not config.validate_string(chord_string):
-                            return  TabFormatError(
-                                measure = measure_idx,
-                                message = f"Invalid string {chord_string} in chord for {config.name}",
-                                suggestion = f"Use strings 1-{config.strings} for {config.name}"
-                            )
-
-    logger.debug(f"All events validated for {config.name}")
+        for measure_idx, measure in enumerate(part.measures, 1):
+            for event_class in measure.notation_events():
+                instrument_error = validate_event_instrument(event_class, config, measure_idx)
+                if instrument_error:
+                    return instrument_error
+
+    logger.debug("All events validated for %s", config.name)
+    return None
+
+def validate_event_instrument(event_class: NotationEvent, config: InstrumentConfig, measure_idx: int) -> TabError:
+    """Check the string numbers used by a single event against the instrument."""
+    # Validate string numbers
+    string_num = getattr(event_class, "string", None)
+    if string_num is not None:
+        if not config.validate_string(string_num):
+            return  TabFormatError(
+                measure = measure_idx,
+                message = f"Invalid string {string_num} for {config.name}",
+                suggestion = f"Use strings 1-{config.strings} for {config.name}"
+            )
+
+    # Validate chord frets
+    if isinstance( event_class, Chord):
+        for fret_info in event_class.frets:
+            chord_string = fret_info.get("string")
+            if chord_string and not config.validate_string(chord_string):
+                return  TabFormatError(
+                    measure = measure_idx,
+                    message = f"Invalid string {chord_string} in chord for {config.name}",
+                    suggestion = f"Use strings 1-{config.strings} for {config.name}"
+                )
+
     return None
 
 def validate_tab_data(request: TabRequest) -> TabError:
     """validation pipeline."""
-    logger.debug(f"Running validation for attempt {request.attempt}")
+    logger.debug("Running validation for attempt %s", request.attempt)
 
     # Stage 1: Schema validation
     schema_result = validate_schema(request)
     if schema_result:
         return schema_result
 
-    # Stage 2: Timing validation
-    timing_result = validate_timing(request)
-    if timing_result:
-        return timing_result
-
-    # Stage 3: Conflict validation
-    conflict_result = validate_conflicts(request)
-    if conflict_result:
-        return conflict_result
-
-    # Stage 4: Strum pattern validation
-    strum_result = StrumPattern.validate_strum_patterns(request)
-    if strum_result:
-        return strum_result
-
-    # Stage 5: Emphasis validation
-    emphasis_result = validate_emphasis_markings(request)
-    if emphasis_result:
-        return emphasis_result
-
-    # Stage 6: Instrument validation
-    instrument_result = validate_instrument_events(request)
-    if instrument_result:
-        logger.warning(f"Instrument validation failed: {instrument_result.message}")
-        return instrument_result
-
-    # Stage 7: Validate custom tuning
+    # Stage 2: Timing, conflict, strum pattern, emphasis and instrument
+    # validation (single pass over events)
+    events_result = validate_events(request)
+    if events_result:
+        return events_result
+
+    # Stage 3: Validate custom tuning
     tuning_result = validate_custom_tuning(request)
     if tuning_result:
         return tuning_result